@@ -10,8 +10,95 @@ Version: 1.1.5  (dark theme, no View menu, robust Windows title-bar icon)
   HiDPI awareness, and Windows taskbar AppUserModelID for correct icon grouping.
 """
 
-import os, sys, json, threading, subprocess, shutil, queue, re
+import os, sys, json, threading, subprocess, shutil, queue, re, collections, functools, itertools, time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+
+try:
+    import orjson  # optional: faster presets/config (de)serialisation
+except Exception:
+    orjson = None
+
+# ---------- Settings files ----------
+# hash() of the bytes each settings file last held (read or written) in this session;
+# saves that would rewrite identical bytes are skipped
+_JSON_FILE_HASHES = {}
+
+def _read_json(path: Path):
+    with open(path, "rb") as f:
+        data = f.read()
+    _JSON_FILE_HASHES[path] = hash(data)
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def _write_json_atomic(path: Path, data, pretty=True) -> None:
+    # Write a sibling temp file and swap it in, so a crash mid-write never truncates the original
+    if orjson:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    else:
+        payload = json.dumps(data, indent=4 if pretty else None).encode("utf-8")
+    digest = hash(payload)
+    if _JSON_FILE_HASHES.get(path) == digest and path.exists():
+        return
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(payload)
+    os.replace(tmp, path)
+    _JSON_FILE_HASHES[path] = digest
+
+class TagCache:
+    """Tags + duration per file, keyed by path and validated against (mtime_ns, size).
+
+    Shared by the tag-read tasks, so every access takes the lock. Loaded on first use
+    and written back with save() once a batch of reads has finished.
+    """
+    def __init__(self, path: Path):
+        self.path = path
+        self._entries = None  # path -> [mtime_ns, size, title, artist, album, duration]
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock() # one writer at a time on the shared .tmp file
+
+    def _load(self):
+        try:
+            self._entries = _read_json(self.path)
+        except Exception:
+            self._entries = {}
+
+    def get(self, path_str, st):
+        with self._lock:
+            if self._entries is None:
+                self._load()
+            entry = self._entries.get(path_str)
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return {"title": entry[2], "artist": entry[3], "album": entry[4]}, entry[5]
+        return None
+
+    def put(self, path_str, st, tags, duration):
+        with self._lock:
+            if self._entries is None:
+                self._load()
+            self._entries.pop(path_str, None)  # re-insert so it counts as newest
+            self._entries[path_str] = [st.st_mtime_ns, st.st_size,
+                                       tags["title"], tags["artist"], tags["album"], duration]
+            self._dirty = True
+
+    def save(self):
+        # The write stays outside _lock so reads aren't held up by disk I/O
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                excess = len(self._entries) - TAG_CACHE_MAX
+                if excess > 0:
+                    for key in list(itertools.islice(self._entries, excess)):
+                        del self._entries[key]
+                entries = dict(self._entries)
+                self._dirty = False
+            try:
+                _write_json_atomic(self.path, entries, pretty=False)
+            except OSError:
+                pass  # cache only
 
 # ---------- Windows HiDPI ----------
 def _enable_windows_dpi_awareness():
@@ -30,7 +117,8 @@ def _ensure_ico_from_png(png_path: Path, ico_path: Path) -> bool:
         from PIL import Image  # pillow
         if png_path.is_file():
             png = Image.open(png_path).convert("RGBA")
-            sizes = [(16,16),(20,20),(24,24),(32,32),(40,40),(48,48),(64,64),(128,128),(256,256)]
+            # Title bar uses 16/32, taskbar 32/48, Explorer large icons 256
+            sizes = [(16,16),(32,32),(48,48),(256,256)]
             png.save(ico_path, format="ICO", sizes=sizes)
             return True
     except Exception:
@@ -38,19 +126,45 @@ def _ensure_ico_from_png(png_path: Path, ico_path: Path) -> bool:
     return False
 
 # ---------- Theming ----------
-try:
-    import ttkbootstrap as tb
-    from ttkbootstrap.constants import *
-except Exception:
-    tb = None
+def _load_ttkbootstrap():
+    # Imported on demand: ttkbootstrap pulls in a large module graph. MF_NO_TB=1 skips it.
+    if os.environ.get("MF_NO_TB"):
+        return None
+    try:
+        import ttkbootstrap as tb
+        return tb
+    except Exception:
+        return None
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
-from mutagen import File
+try:
+    from tinytag import TinyTag  # fast header-only tag reader; mutagen is the fallback
+except Exception:
+    TinyTag = None
 from tkinterdnd2 import DND_FILES, TkinterDnD
-import pygame
 
-APP_INFO = {
+# mutagen and pygame are imported on first use, so neither delays the first paint
+@functools.lru_cache(maxsize=None)
+def _mutagen_file():
+    # Only needed when TinyTag can't read a file, and for tag copies
+    from mutagen import File
+    return File
+
+pygame = None  # set by _load_pygame() when the player is first used
+
+def _load_pygame():
+    global pygame
+    if pygame is None:
+        import pygame as pg
+        # A larger buffer rides out CPU spikes from parallel encodes
+        pg.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=4096)
+        pg.mixer.init()
+        pygame = pg
+    return pygame
+
+# Read-only, so the dialog texts built from it below can't go stale
+APP_INFO = MappingProxyType({
     "name": "Music Forge",
     "version": "1.1.5",
     "developer": "Guillaume Lessard",
@@ -58,7 +172,29 @@ APP_INFO = {
     "contact": "itechinfomtl@gmail.com",
     "website": "https://www.id01t.ca",
     "appid": "iD01tProductions.MusicForge"
-}
+})
+
+# Dialog texts are fixed, so build them once
+_ABOUT_TEXT = (
+    f"{APP_INFO['name']} v{APP_INFO['version']}\n"
+    f"Developed by {APP_INFO['developer']} — {APP_INFO['company']}\n"
+    f"Contact: {APP_INFO['contact']} | Web: {APP_INFO['website']}"
+)
+_HELP_TEXT = (
+    "How to Use:\n"
+    "1. Add Files: Click 'Add Files', 'Add Folder', or drag and drop files onto the queue.\n"
+    "2. Set Options: Pick a preset or manually set the format, quality, and other options.\n"
+    "3. Customize (Optional):\n"
+    "   - Presets: Save current settings as a new preset or delete custom ones.\n"
+    "   - Naming: Define an output filename pattern using tags like [artist], [title], etc.\n"
+    "   - Tags: Double-click a file or use 'Edit Tags' to modify its metadata for the output.\n"
+    "4. Choose Output Directory.\n"
+    "5. Click 'Compile Music' to start.\n\n"
+    "File Naming Tags:\n"
+    "Use [artist], [album], [title], and [filename] in the naming pattern field.\n\n"
+    "FFmpeg: place it next to the app, in ./bin, or in PATH. "
+    "Set FFMPEG_PATH env var to force a specific binary."
+)
 
 def _base_dir() -> Path:
     # When frozen by PyInstaller, assets live under _MEIPASS
@@ -70,6 +206,20 @@ BASE_DIR = _base_dir()
 ASSETS_DIR = BASE_DIR / "assets_music_forge"
 CUSTOM_PRESETS_FILE = BASE_DIR / "presets.json"
 CONFIG_FILE = BASE_DIR / "config.json"
+FFMPEG_PROBE_CACHE = BASE_DIR / ".ffmpeg_probe.json"
+TAG_CACHE_FILE = BASE_DIR / ".tag_cache.json"
+TAG_CACHE_MAX = 50000  # entries kept on disk; the oldest are dropped first
+QUEUE_FILE = BASE_DIR / ".queue.json"  # queued paths, restored on the next launch
+
+# Worker threads never touch Tk: progress, status, log lines and tag results are queued
+# and applied by MusicForgePro._ui_tick every UI_TICK_MS on the Tk thread.
+UI_TICK_MS = 50
+LOG_BUFFER_MAX = 10000  # pending log lines kept between ticks
+_LOG_TAGS = {"info": "", "warn": "warn", "error": "error"}  # log level -> Text tag
+TAG_DRAIN_BATCH = 500   # tag results applied per tick
+TAG_READ_CHUNK = 200    # files per tag-read task, so large adds spread over the task pool
+_PCT_STRS = tuple(f"{i}%" for i in range(101))  # progress label texts, indexed by percent
+_TIME_STRS = tuple(f"{s // 60:02d}:{s % 60:02d}" for s in range(3601))  # player "mm:ss", up to an hour
 
 # Candidate icon locations
 def _find_icon_candidates():
@@ -85,18 +235,35 @@ def _find_icon_candidates():
         ]
     }
 
-def _resolve_icons():
+_ICON_CACHE = None  # (ico, png) once resolved; icon files don't change while the app runs
+
+def _resolve_icons(build=True):
+    # build=False never runs Pillow: an ICO that still needs building is reported as None (uncached)
+    global _ICON_CACHE
+    if _ICON_CACHE is not None:
+        return _ICON_CACHE
     cand = _find_icon_candidates()
     ico = next((p for p in cand["ico"] if p.is_file()), None)
     png = next((p for p in cand["png"] if p.is_file()), None)
 
-    # Auto-build ICO from PNG if needed
-    if ico is None and png is not None:
+    # Auto-build ICO from PNG if needed. A previous build is reused as-is (Pillow is never
+    # imported) unless the PNG is newer; with no PNG around, any previous build still counts.
+    if ico is None:
         target = BASE_DIR / "icon_auto.ico"
-        if _ensure_ico_from_png(png, target) and target.exists():
+        try:
+            auto_mtime = target.stat().st_mtime_ns
+        except OSError:
+            auto_mtime = None
+        if auto_mtime is not None and (png is None or png.stat().st_mtime_ns <= auto_mtime):
             ico = target
+        elif png is not None:
+            if not build:
+                return None, png
+            if _ensure_ico_from_png(png, target) and target.exists():
+                ico = target
 
-    return ico, png
+    _ICON_CACHE = (ico, png)
+    return _ICON_CACHE
 
 # ---------- FFmpeg discovery ----------
 def find_ffmpeg() -> str:
@@ -114,6 +281,143 @@ def find_ffmpeg() -> str:
     return which if which else "ffmpeg"
 FFMPEG_BIN = find_ffmpeg()
 
+def find_ffprobe():
+    # ffprobe ships alongside ffmpeg; only used for optional fast paths, so None is fine
+    folder, name = os.path.split(FFMPEG_BIN)
+    sibling = os.path.join(folder, name.replace("ffmpeg", "ffprobe"))
+    if folder and os.path.isfile(sibling):
+        return sibling
+    return shutil.which("ffprobe")
+FFPROBE_BIN = find_ffprobe()
+
+# Per-file ffmpeg/ffprobe children: no console window on Windows (the windowed build would
+# otherwise create one per spawn) and no inherited stdin, so ffmpeg never waits on keys.
+_CHILD_POPEN_KW = {"stdin": subprocess.DEVNULL}
+if sys.platform.startswith("win"):
+    _CHILD_POPEN_KW["creationflags"] = subprocess.CREATE_NO_WINDOW
+# Reaping ffmpeg with wait4 gives its CPU time, which (unlike wall time) parallel encodes don't inflate
+_HAVE_WAIT4 = hasattr(os, "wait4")
+
+def _ffmpeg_probe_key():
+    # Identifies the exact binary a cached "-version" probe was run against
+    try:
+        st = os.stat(FFMPEG_BIN)
+    except OSError:
+        return None
+    return [FFMPEG_BIN, st.st_mtime_ns, st.st_size]
+
+# ---------- Folder scan ----------
+_AUDIO_EXT = ('.mp3', '.wav', '.flac', '.ogg', '.m4a', '.aac', '.wma')
+
+FOLDER_SCAN_THREADS = 4  # Directory walking is I/O-bound; threads overlap disk latency
+
+def _scan_dir(d: str, subdirs: list, found: dict):
+    """One os.scandir pass: queue non-hidden subfolders, record {path: size} of audio files."""
+    try:
+        with os.scandir(d) as it:
+            for e in it:
+                name = e.name
+                if e.is_dir(follow_symlinks=False):
+                    if not name.startswith("."):
+                        subdirs.append(e.path)
+                elif name.lower().endswith(_AUDIO_EXT):
+                    try:
+                        size = e.stat().st_size
+                    except OSError:
+                        size = None
+                    found[e.path] = size
+    except OSError:
+        pass
+
+def _walk_audio_files(root: str) -> dict:
+    found = {}
+    stack = [root]
+    while stack:
+        _scan_dir(stack.pop(), stack, found)
+    return found
+
+def _scan_audio_folder(root: str) -> dict:
+    """{path: size} for audio files under root; top-level subfolders are walked in parallel."""
+    subdirs, found = [], {}
+    _scan_dir(root, subdirs, found)
+    if subdirs:
+        with ThreadPoolExecutor(max_workers=min(FOLDER_SCAN_THREADS, len(subdirs))) as ex:
+            for sub in ex.map(_walk_audio_files, subdirs):
+                found.update(sub)
+    return found
+
+def _human_size(n: int) -> str:
+    return f"{n/1048576:.2f} MB"
+
+# ---------- Output naming ----------
+_NAMING_TOKEN_RE = re.compile(r"\[(artist|album|title|filename)\]")
+_FILENAME_BAD_CHARS = str.maketrans(dict.fromkeys('\\/*?:"<>|', "_"))
+
+def _naming_template(pattern: str) -> str:
+    # "[Artist] - [title]" -> "{artist} - {title}": compiled once per run, format_map per file
+    escaped = pattern.lower().replace("{", "{{").replace("}", "}}")
+    return _NAMING_TOKEN_RE.sub(r"{\1}", escaped)
+
+# ---------- FFmpeg codec arguments (quality -> args), shared across calls ----------
+_MP3_QMAP = {"low":("-b:a","128k"),"medium":("-b:a","192k"),"high":("-b:a","320k"),"lossless":("-b:a","320k")}
+_OGG_QMAP = {"low":("-q:a","3"),"medium":("-q:a","6"),"high":("-q:a","9"),"lossless":("-q:a","10")}
+_M4A_QMAP = {"low":("-c:a","aac","-b:a","128k"),"medium":("-c:a","aac","-b:a","192k"),"high":("-c:a","aac","-b:a","256k"),"lossless":("-c:a","aac","-b:a","320k")}
+_WAV_ARGS = ("-acodec", "pcm_s16le")
+_FLAC_ARGS = ("-acodec", "flac", "-compression_level", "5")
+
+def _codec_args(fmt: str, qual: str) -> tuple:
+    """Encoder arguments for an output format at a quality level."""
+    if fmt == "mp3":
+        return _MP3_QMAP.get(qual, _MP3_QMAP["medium"])
+    if fmt == "wav":
+        return _WAV_ARGS
+    if fmt == "flac":
+        return _FLAC_ARGS
+    if fmt == "ogg":
+        return _OGG_QMAP.get(qual, _OGG_QMAP["medium"])
+    if fmt == "m4a":
+        return _M4A_QMAP.get(qual, _M4A_QMAP["medium"])
+    return ()
+
+# Encoder effort levels per format, best first, seeded with rough single-thread speeds (× realtime).
+# With a speed target set, the best level whose estimate meets it is used; estimates are refined
+# from measured encodes with an exponential moving average of weight SPEED_EMA_WEIGHT. Only
+# unfiltered encodes are measured, per CPU second, so filters and parallel jobs don't skew them.
+_SPEED_LEVELS = {
+    "mp3": {2: 30.0, 5: 45.0, 7: 60.0},     # libmp3lame: lower is better quality and slower
+    "flac": {8: 80.0, 5: 200.0, 0: 300.0},  # higher is smaller output and slower
+}
+SPEED_EMA_WEIGHT = 0.2
+
+def _with_compression_level(args: tuple, level: int) -> tuple:
+    if "-compression_level" in args:
+        i = args.index("-compression_level")
+        return args[:i + 1] + (str(level),) + args[i + 2:]
+    return args + ("-compression_level", str(level))
+
+def _audio_filter_chain(trim_silence: bool, normalize: bool, fast_normalize: bool) -> str:
+    """The -af graph for a run, or "" when no filter is active."""
+    afilters = []
+    if trim_silence:
+        afilters.append("silenceremove=start_periods=1:start_threshold=-45dB:start_silence=0.4")
+    if normalize:
+        # loudnorm in single-pass mode upsamples to 192 kHz internally; dynaudnorm works at
+        # the source rate and is much cheaper, at the cost of not hitting an exact LUFS target
+        if fast_normalize:
+            afilters.append("dynaudnorm=f=150:g=15")
+        else:
+            afilters.append("loudnorm=I=-14:TP=-1.5:LRA=11")
+    return ",".join(afilters)
+
+# Formats whose tags mutagen's easy interface can write in place of an ffmpeg remux
+_TAG_COPY_FORMATS = ("mp3", "flac", "m4a")
+
+_MISSING = object()  # cache-miss sentinel where None is a valid cached value
+
+# ---------- FFmpeg output parsing ----------
+_PROGRESS_LINE_RE = re.compile(rb"^(\w+)=(\S*)$")
+_DURATION_RE = re.compile(rb"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)")
+
 # ---------- AppID ----------
 def _set_taskbar_appid(app_id: str):
     try:
@@ -128,37 +432,31 @@ class Worker(threading.Thread):
     def __init__(self, app):
         super().__init__(daemon=True)
         self.app = app
-        self.q: "queue.Queue[tuple]" = queue.Queue()
-        self._stop = threading.Event()
+        # SimpleQueue.get() parks the thread in C with no timeout, so an idle worker never wakes
+        self.jobs: "queue.SimpleQueue[tuple | None]" = queue.SimpleQueue()
 
     def run(self):
-        while not self._stop.is_set():
-            try:
-                job = self.q.get(timeout=0.2)
-            except queue.Empty:
-                continue
-            if job is None:
+        while True:
+            job = self.jobs.get()
+            if job is None:  # stop() sentinel
                 break
             func, args, kwargs = job
             try:
                 func(*args, **kwargs)
             except Exception as e:
                 self.app.log(f"[error] {e}", "error")
-            finally:
-                self.q.task_done()
 
     def stop(self):
-        self._stop.set()
-        try: self.q.put_nowait(None)
-        except Exception: pass
+        self.jobs.put(None)
 
     def submit(self, func, *args, **kwargs):
-        self.q.put((func, args, kwargs))
+        self.jobs.put((func, args, kwargs))
 
 # ---------- App ----------
 class MusicForgePro:
     def __init__(self):
         # Force dark UI
+        tb = _load_ttkbootstrap()
         if tb:
             self.root = TkinterDnD.Tk() # Use DND-aware Tk root
             self.style = tb.Style()
@@ -171,21 +469,47 @@ class MusicForgePro:
         self.root.minsize(980, 640)
 
         _set_taskbar_appid(APP_INFO["appid"])
-        self._apply_icons()   # <- apply icons early
+        self._icon_photo = None
+        icons_pending = self._apply_icons(build=False) is None   # <- apply icons early, whatever is on disk
 
         # State
         self.file_queue = []
+        self._queue_set = set() # Normalised paths in file_queue, for O(1) duplicate checks
+        self._items_by_id = {} # Treeview iid -> file_queue entry, for O(1) selection lookups
+        self._queue_generation = 0 # Bumped on clear; stale deferred row inserts are dropped
+        self._row_ids = itertools.count() # Treeview iids for queue rows
+        self._tag_results = queue.Queue() # (generation, file_item, tags, duration, size) from _bulk_read_tags
+        self._tag_cache = TagCache(TAG_CACHE_FILE)
+        self._tag_reads_pending = 0 # _bulk_read_tags chunks in flight; the last one saves the cache
+        self._tag_reads_lock = threading.Lock()
+        self._ui_q = queue.Queue() # ("call", func, args) from worker threads
+        self._pending_pct = None # Latest progress/status from workers, taken by _ui_tick
+        self._pending_status = None
+        self._pending_lock = threading.Lock()
+        self._alive = True # cleared on close; workers stop posting UI updates
+        self._last_pct_shown = 0
+        self._probe_cache = {}  # path -> ffprobe stream info (or None)
+        self._queue_restored = False # until then, closing must not overwrite .queue.json
+        self._compile_pool = None # running compile's job pool; shut down on close
+        self._children = set() # live ffmpeg processes, terminated on close
+        self._children_lock = threading.Lock()
+        self._tag_editor = None # hidden TagEditorWindow, reused for every edit
         self.output_format = tk.StringVar(value="mp3")
         self.quality_setting = tk.StringVar(value="high")
         self.normalize = tk.BooleanVar(value=False)
+        self.fast_normalize = tk.BooleanVar(value=False) # dynaudnorm instead of loudnorm
         self.trim_silence = tk.BooleanVar(value=False)
         self.sample_rate = tk.IntVar(value=44100)
         self.channels = tk.IntVar(value=2)
+        self.speed_target = tk.StringVar(value="off") # × realtime per encode, or "off"
+        self._speed_table = {fmt: dict(levels) for fmt, levels in _SPEED_LEVELS.items()}
+        self._speed_lock = threading.Lock()
         self.output_directory = tk.StringVar(value=str(Path.home() / "Music" / "MusicForge_Output"))
         self.naming_pattern = tk.StringVar(value="[artist] - [title]")
-        self.progress_var = tk.DoubleVar(value=0.0)
         self.count_var = tk.StringVar(value="0 files")
         self.status_var = tk.StringVar(value="Ready — Add audio files to begin")
+        self._log_buf = []  # (text, level) pending for the log widget
+        self._log_lock = threading.Lock()
 
         # Player state
         self.player_track_var = tk.StringVar(value="No track selected")
@@ -195,12 +519,10 @@ class MusicForgePro:
         self.selected_track_path = None
         self.track_length_sec = 0
         self.seeking = False
-
-        # Init Pygame Mixer
-        try:
-            pygame.mixer.init()
-        except Exception as e:
-            self.log(f"Could not initialize audio player: {e}", "error")
+        self.is_paused = False
+        self._play_start = 0.0 # time.monotonic() at which playback position 0 would have been
+        self._play_offset = 0.0 # position kept while paused
+        self._last_displayed_sec = -1 # whole second last written to player_time_var
 
         # Presets
         self.default_presets = {
@@ -213,19 +535,32 @@ class MusicForgePro:
         self.current_preset = tk.StringVar(value="High MP3")
         self.theme_var = tk.StringVar(value="darkly")
 
-        # Background worker
+        # Background workers: one thread for the long compile job, a small pool for
+        # support tasks (tag reads, FFmpeg probe) so they never queue behind a compile
         self.worker = Worker(self); self.worker.start()
+        self.tasks = ThreadPoolExecutor(max_workers=max(2, (os.cpu_count() or 2) // 2), thread_name_prefix="mf-task")
 
         # Build UI and load settings
         self._build_layout()
+        self.root.after(UI_TICK_MS, self._ui_tick)
         self._load_config() # This will set the theme
         self._load_presets()
         self._apply_preset("High MP3")
-        self._check_ffmpeg()
+        self.ffmpeg_available = False
+        self._submit_task(self._check_ffmpeg)
+        if icons_pending:
+            self._submit_task(self._build_icons)
+        self.root.after_idle(self._get_tag_editor) # build the hidden editor once the window is up
+        self._submit_task(self._restore_queue)
 
     # ----- Icons -----
-    def _apply_icons(self):
-        ico_path, png_path = _resolve_icons()
+    def _build_icons(self):
+        # Task pool: PNG→ICO conversion runs after the window is up, then the icons are reapplied
+        _resolve_icons()
+        self._ui_call(self._apply_icons)
+
+    def _apply_icons(self, build=True):
+        ico_path, png_path = _resolve_icons(build)
 
         # On Windows, iconbitmap controls the *title bar* icon. Must be an .ico with 16x16 present.
         try:
@@ -239,11 +574,14 @@ class MusicForgePro:
         # iconphoto controls the taskbar/dock and Alt-Tab preview in many cases
         try:
             if png_path and png_path.exists():
-                logo = tk.PhotoImage(file=str(png_path))
+                # Decoded once and kept on self: Tk drops the icon if the PhotoImage is garbage collected
+                if self._icon_photo is None:
+                    self._icon_photo = tk.PhotoImage(file=str(png_path))
                 # Ensure it's applied as the window's photo icon (cover multi-platform cases)
-                self.root.iconphoto(True, logo)
+                self.root.iconphoto(True, self._icon_photo)
         except Exception:
             pass
+        return ico_path
 
     # ----- Layout (no View menu) -----
     def _build_layout(self):
@@ -322,7 +660,12 @@ class MusicForgePro:
         ttk.Label(sidebar, text="Channels").pack(anchor="w")
         ttk.Combobox(sidebar, textvariable=self.channels, values=[1,2], state='readonly', width=20).pack(pady=(2,8))
 
+        ttk.Label(sidebar, text="Speed Target (× realtime)").pack(anchor="w")
+        ttk.Combobox(sidebar, textvariable=self.speed_target,
+                     values=['off','25','50','100','200'], state='readonly', width=20).pack(pady=(2,8))
+
         ttk.Checkbutton(sidebar, text="🔊 Loudness Normalize", variable=self.normalize).pack(anchor="w", pady=(6,2))
+        ttk.Checkbutton(sidebar, text="⚡ Fast Normalize (dynaudnorm)", variable=self.fast_normalize).pack(anchor="w", padx=(18,0), pady=(0,2))
         ttk.Checkbutton(sidebar, text="✂️ Trim Silence", variable=self.trim_silence).pack(anchor="w", pady=(0,8))
 
         ttk.Separator(sidebar).pack(fill="x", pady=10)
@@ -379,7 +722,7 @@ class MusicForgePro:
         footer = ttk.Frame(main)
         footer.grid(row=2, column=0, sticky="ew", pady=(10, 0))
         footer.columnconfigure(0, weight=1)
-        self.progress = ttk.Progressbar(footer, variable=self.progress_var, maximum=100)
+        self.progress = ttk.Progressbar(footer, value=0, maximum=100)
         self.progress.grid(row=0, column=0, sticky="ew")
         self.progress_label = ttk.Label(footer, text="0%")
         self.progress_label.grid(row=0, column=1, padx=(10,0))
@@ -427,8 +770,7 @@ class MusicForgePro:
     def _load_presets(self):
         if CUSTOM_PRESETS_FILE.exists():
             try:
-                with open(CUSTOM_PRESETS_FILE, "r") as f:
-                    self.custom_presets = json.load(f)
+                self.custom_presets = _read_json(CUSTOM_PRESETS_FILE)
             except (json.JSONDecodeError, IOError):
                 self.custom_presets = {}
                 self.log("Could not load custom presets from file.", "warn")
@@ -456,6 +798,8 @@ class MusicForgePro:
             "format": self.output_format.get(),
             "quality": self.quality_setting.get(),
             "normalize": self.normalize.get(),
+            "fast_normalize": self.fast_normalize.get(),
+            "speed_target": self.speed_target.get(),
             "trim_silence": self.trim_silence.get(),
             "samplerate": self.sample_rate.get(),
             "channels": self.channels.get()
@@ -463,8 +807,7 @@ class MusicForgePro:
         self.custom_presets[name] = preset_data
 
         try:
-            with open(CUSTOM_PRESETS_FILE, "w") as f:
-                json.dump(self.custom_presets, f, indent=4)
+            _write_json_atomic(CUSTOM_PRESETS_FILE, self.custom_presets)
             self.log(f'Preset "{name}" saved.')
             self._update_preset_combobox()
             self.current_preset.set(name)
@@ -486,8 +829,7 @@ class MusicForgePro:
         if messagebox.askyesno("Confirm Delete", f'Are you sure you want to delete the preset "{name}"?', parent=self.root):
             del self.custom_presets[name]
             try:
-                with open(CUSTOM_PRESETS_FILE, "w") as f:
-                    json.dump(self.custom_presets, f, indent=4)
+                _write_json_atomic(CUSTOM_PRESETS_FILE, self.custom_presets)
                 self.log(f'Preset "{name}" deleted.')
                 self._update_preset_combobox()
                 self.current_preset.set(list(self.default_presets.keys())[0])
@@ -501,6 +843,8 @@ class MusicForgePro:
         self.output_format.set(p["format"])
         self.quality_setting.set(p["quality"])
         self.normalize.set(p["normalize"])
+        self.fast_normalize.set(p.get("fast_normalize", False)) # absent in older preset files
+        self.speed_target.set(p.get("speed_target", "off"))
         self.trim_silence.set(p["trim_silence"])
         self.sample_rate.set(p["samplerate"])
         self.channels.set(p["channels"])
@@ -510,26 +854,52 @@ class MusicForgePro:
     # ----- Theming -----
     def _load_config(self):
         try:
-            with open(CONFIG_FILE, "r") as f:
-                config = json.load(f)
-                self.theme_var.set(config.get("theme", "darkly"))
+            config = _read_json(CONFIG_FILE)
+            self.theme_var.set(config.get("theme", "darkly"))
+            self._load_speed_table(config.get("speed_table") or {})
         except (IOError, json.JSONDecodeError):
             self.theme_var.set("darkly") # Default theme
 
-        self.style.theme_use(self.theme_var.get())
-        self.log(f"Theme '{self.theme_var.get()}' loaded.")
+        try:
+            self.style.theme_use(self.theme_var.get())
+            self.log(f"Theme '{self.theme_var.get()}' loaded.")
+        except tk.TclError:
+            # Plain ttk (no ttkbootstrap) has none of the bootstrap themes
+            self.log(f"Theme '{self.theme_var.get()}' unavailable; using default ttk theme.", "warn")
+
+    def _load_speed_table(self, saved):
+        # Measured speeds from earlier sessions replace the seeds; JSON keys come back as strings.
+        # Only known formats/levels are taken, so the best-first level order is kept.
+        for fmt, levels in saved.items():
+            table = self._speed_table.get(fmt)
+            if table is None or not isinstance(levels, dict):
+                continue
+            for level, speed in levels.items():
+                try:
+                    level, speed = int(level), float(speed)
+                except (TypeError, ValueError):
+                    continue
+                if level in table and speed > 0:
+                    table[level] = speed
 
     def _save_config(self):
-        config = {"theme": self.theme_var.get()}
+        with self._speed_lock:
+            speed_table = {fmt: {str(level): speed for level, speed in levels.items()}
+                           for fmt, levels in self._speed_table.items()}
+        config = {"theme": self.theme_var.get(), "speed_table": speed_table}
         try:
-            with open(CONFIG_FILE, "w") as f:
-                json.dump(config, f, indent=4)
+            _write_json_atomic(CONFIG_FILE, config)
         except IOError:
             self.log("Error saving config file.", "error")
 
     def _change_theme(self):
         theme = self.theme_var.get()
-        self.style.theme_use(theme)
+        try:
+            self.style.theme_use(theme)
+        except tk.TclError:
+            # Plain ttk (MF_NO_TB=1 or no ttkbootstrap): keep the current theme and the saved one
+            self.log(f"Theme '{theme}' unavailable without ttkbootstrap.", "warn")
+            return
         self.log(f"Theme changed to '{theme}'")
         self._save_config()
 
@@ -540,45 +910,65 @@ class MusicForgePro:
             messagebox.showinfo("No Selection", "Please select one or more files to edit.", parent=self.root)
             return
 
-        file_items = [item for item in self.file_queue if item["id"] in selected_ids]
+        # Every row in the tree has an entry; the guard only covers a clear racing the event
+        file_items = [self._items_by_id[iid] for iid in selected_ids if iid in self._items_by_id]
 
         if file_items:
-            TagEditorWindow(self.root, file_items, self._update_tags_for_items)
+            self._get_tag_editor().load(file_items, self._update_tags_for_items)
+
+    def _get_tag_editor(self):
+        if self._tag_editor is None:
+            self._tag_editor = TagEditorWindow(self.root)
+        return self._tag_editor
 
     def _update_tags_for_items(self, file_items, new_tags_to_apply):
         for item in file_items:
-            # Update the data model
+            # Update the data model, then only the edited cells (tag keys double as column ids);
+            # the rest of the row can't have changed
+            item["tags"].update(new_tags_to_apply)
             for key, value in new_tags_to_apply.items():
-                item["tags"][key] = value
-
-            # Update the treeview
-            p = Path(item["path"])
-            size = p.stat().st_size if p.exists() else 0
-            size_mb = f"{size/1024/1024:.2f} MB"
-            ext = p.suffix.lower().replace('.', '').upper()
-
-            self.tree.item(item["id"], values=(
-                p.name, item["tags"].get('title',''), item["tags"].get('artist',''), item["tags"].get('album',''),
-                ext, size_mb, str(p)
-            ))
+                self.tree.set(item["id"], key, value)
 
         self.log(f"Updated tags for {len(file_items)} item(s).")
 
     # ----- Player -----
     def _format_time(self, seconds):
-        m, s = divmod(int(seconds), 60)
+        seconds = int(seconds)
+        if 0 <= seconds <= 3600:
+            return _TIME_STRS[seconds]
+        m, s = divmod(seconds, 60)
         return f"{m:02d}:{s:02d}"
 
     def _update_player_progress(self):
-        if pygame.mixer.music.get_busy() and not self.seeking:
-            current_time = pygame.mixer.music.get_pos() / 1000
+        if not self.is_playing:
+            return # paused or stopped; the loop is restarted on play/resume
+        # get_busy() turns False once the track ends (set_endevent would need pygame's
+        # event/video subsystem, which the app never initialises)
+        if not pygame.mixer.music.get_busy():
+            self._on_track_end()
+            return
+        if not self.seeking:
+            # Position from our own clock: get_pos() restarts at 0 after every seek
+            current_time = min(time.monotonic() - self._play_start, self.track_length_sec)
+            # The slider moves ~0.5 s every tick, so it is always written; the time label only
+            # changes once per second, so its var write (Tcl trace + redraw) is skipped otherwise
             self.player_slider_var.set(current_time)
+            sec = int(current_time)
+            if sec != self._last_displayed_sec:
+                self._last_displayed_sec = sec
+                time_str = f"{self._format_time(sec)} / {self._format_time(self.track_length_sec)}"
+                self.player_time_var.set(time_str)
 
-            time_str = f"{self._format_time(current_time)} / {self._format_time(self.track_length_sec)}"
-            self.player_time_var.set(time_str)
+        self.root.after(500, self._update_player_progress)
 
-        if self.is_playing:
-            self.root.after(500, self._update_player_progress)
+    def _on_track_end(self):
+        # Keep the track loaded and rewind, so Play starts it again
+        self.play_btn.configure(text="▶ Play")
+        self.is_playing = False
+        self.is_paused = False
+        self.player_slider_var.set(0)
+        self._last_displayed_sec = 0
+        self.player_time_var.set(f"00:00 / {self._format_time(self.track_length_sec)}")
 
     def _on_track_select(self, event=None):
         selected_ids = self.tree.selection()
@@ -586,16 +976,22 @@ class MusicForgePro:
             return
 
         item_id = selected_ids[0]
-        file_item = next((item for item in self.file_queue if item["id"] == item_id), None)
+        file_item = self._items_by_id.get(item_id)
 
         if file_item and file_item["path"] != self.selected_track_path:
+            if not self._ensure_player():
+                return
             self._stop_track()
             try:
-                sound = pygame.mixer.Sound(file_item["path"])
-                self.track_length_sec = sound.get_length()
+                # The tag read already measured the length; decoding the whole file into a
+                # Sound just for get_length() is the fallback for files it couldn't parse
+                length = file_item["duration"]
+                if not length:
+                    length = pygame.mixer.Sound(file_item["path"]).get_length()
+                self.track_length_sec = length
                 self.player_slider.config(to=self.track_length_sec)
                 self.selected_track_path = file_item["path"]
-                self.player_track_var.set(Path(self.selected_track_path).name)
+                self.player_track_var.set(os.path.basename(self.selected_track_path))
                 self.player_time_var.set(f"00:00 / {self._format_time(self.track_length_sec)}")
                 self.log(f"Player loaded: {self.player_track_var.get()}")
             except Exception as e:
@@ -603,28 +999,42 @@ class MusicForgePro:
                 messagebox.showerror("Player Error", f"Could not load file:\n{e}", parent=self.root)
 
 
+    def _ensure_player(self):
+        # pygame and its mixer load on the first track selection rather than at startup
+        try:
+            _load_pygame()
+            return True
+        except Exception as e:
+            self.log(f"Could not initialize audio player: {e}", "error")
+            return False
+
     def _play_pause_track(self):
         if not self.selected_track_path:
             messagebox.showinfo("No Track", "Please select a track from the queue to play.", parent=self.root)
             return
 
         try:
-            if not pygame.mixer.music.get_busy() and not self.is_playing: # Not playing, so start
+            if not self.is_playing and not self.is_paused: # Not playing, so start
                 pygame.mixer.music.load(self.selected_track_path)
                 pygame.mixer.music.play()
+                self._play_start = time.monotonic()
                 self.play_btn.configure(text="⏸ Pause")
                 self.is_playing = True
                 self.log(f"Playing: {self.player_track_var.get()}")
                 self._update_player_progress() # Start the update loop
             elif self.is_playing: # Playing, so pause
                 pygame.mixer.music.pause()
+                self._play_offset = time.monotonic() - self._play_start
                 self.play_btn.configure(text="▶ Play")
                 self.is_playing = False
+                self.is_paused = True
                 self.log("Player paused.")
             else: # Paused, so unpause
                 pygame.mixer.music.unpause()
+                self._play_start = time.monotonic() - self._play_offset
                 self.play_btn.configure(text="⏸ Pause")
                 self.is_playing = True
+                self.is_paused = False
                 self.log("Player resumed.")
                 self._update_player_progress() # Resume the update loop
         except Exception as e:
@@ -642,36 +1052,76 @@ class MusicForgePro:
         if self.selected_track_path:
             pos = self.player_slider_var.get()
             pygame.mixer.music.play(start=pos)
+            self._play_start = time.monotonic() - pos
             # Instantly update time display after seek
+            self._last_displayed_sec = int(pos)
             time_str = f"{self._format_time(pos)} / {self._format_time(self.track_length_sec)}"
             self.player_time_var.set(time_str)
 
     def _stop_track(self):
-        pygame.mixer.music.stop()
+        if pygame is not None:
+            pygame.mixer.music.stop()
         self.play_btn.configure(text="▶ Play")
         self.is_playing = False
+        self.is_paused = False
         self.player_track_var.set("No track selected")
         self.player_time_var.set("00:00 / 00:00")
         self.player_slider_var.set(0)
+        self._last_displayed_sec = 0
         self.selected_track_path = None
         self.track_length_sec = 0
         self.log("Player stopped.")
 
     # ----- Helpers -----
     def _on_drop(self, event):
-        # The data is a string of file paths, sometimes with curly braces
-        path_str = event.data.replace("{", "").replace("}", "")
-        paths = self.root.splitlist(path_str) # Use tk's splitlist to handle spaces in paths
-        self._add_paths(paths)
+        # The data is a Tcl list of paths: ones with spaces come wrapped in {braces}.
+        # splitlist parses that in one C call; stripping the braces first would split them apart.
+        # Dropped files are queued whatever their suffix, like "All Files" in Add Files. Known audio
+        # suffixes skip the stat; anything else is checked for being a folder to scan like "Add Folder".
+        sizes = {}
+        for path in self.root.splitlist(event.data):
+            if not path.lower().endswith(_AUDIO_EXT) and os.path.isdir(path):
+                sizes.update(_scan_audio_folder(path))
+            else:
+                sizes[path] = None # size comes from the tag read
+        self._add_paths(sizes, sizes)
 
     def _check_ffmpeg(self):
-        try:
-            subprocess.run([FFMPEG_BIN, "-version"], capture_output=True, check=True)
-            self.ffmpeg_available = True
-            self.ffmpeg_label.config(text=f"FFmpeg → {FFMPEG_BIN}")
-            self.log(f"FFmpeg detected: {FFMPEG_BIN}")
-        except Exception:
-            self.ffmpeg_available = False
+        # Runs on the task pool; a cache hit for the same binary skips the subprocess launch
+        key = _ffmpeg_probe_key()
+        version = None
+        if key is not None:
+            try:
+                cached = _read_json(FFMPEG_PROBE_CACHE)
+                if cached.get("key") == key:
+                    version = cached.get("version") or ""
+            except (OSError, ValueError, AttributeError):
+                pass
+        if version is None:
+            try:
+                # Bounded: a hung or blocked binary must not leave the label on "Detecting" forever
+                result = subprocess.run([FFMPEG_BIN, "-version"], capture_output=True, text=True, check=True,
+                                        timeout=10, **_CHILD_POPEN_KW)
+                # First line looks like "ffmpeg version 6.1.1 Copyright (c) ..."
+                m = re.match(r"ffmpeg version (\S+)", result.stdout)
+                version = m.group(1) if m else ""
+            except Exception:
+                version = None
+            if version is not None and key is not None:
+                try:
+                    _write_json_atomic(FFMPEG_PROBE_CACHE, {"key": key, "version": version}, pretty=False)
+                except OSError:
+                    pass
+        self._ui_call(self._set_ffmpeg_status, version)
+
+    def _set_ffmpeg_status(self, version):
+        # version is None when no usable ffmpeg was found
+        self.ffmpeg_available = version is not None
+        if self.ffmpeg_available:
+            label = f"FFmpeg {version}" if version else "FFmpeg"
+            self.ffmpeg_label.config(text=f"{label} → {FFMPEG_BIN}")
+            self.log(f"{label} detected: {FFMPEG_BIN}")
+        else:
             self.ffmpeg_label.config(text="FFmpeg not found")
             self.log("FFmpeg not found — place ffmpeg next to the app or set FFMPEG_PATH", "warn")
 
@@ -703,76 +1153,219 @@ class MusicForgePro:
     def _add_folder(self):
         folder = filedialog.askdirectory(title="Select Folder with Audio Files")
         if not folder: return
-        audio_ext = {'.mp3','.wav','.flac','.ogg','.m4a','.aac','.wma'}
-        files = [str(p) for p in Path(folder).rglob('*') if p.suffix.lower() in audio_ext]
-        self._add_paths(files)
+        sizes = _scan_audio_folder(folder)
+        self._add_paths(sizes, sizes)  # Iterating the dict yields its paths; no list copy
 
-    def _add_paths(self, paths):
-        added = 0
-        existing_paths = {item['path'] for item in self.file_queue}
+    def _add_paths(self, paths, sizes=None):
+        new_items = []
+        queued = self._queue_set
+        normpath, normcase = os.path.normpath, os.path.normcase
         for f_path in paths:
-            if f_path and f_path not in existing_paths:
-                p = Path(f_path)
-                tags = self._read_tags(f_path)
+            if not f_path:
+                continue
+            # Same file spelled differently ("C:/x.mp3" vs "c:\\x.mp3") is still a duplicate.
+            # String-only normalisation: no realpath() syscall per dropped file
+            key = normcase(normpath(f_path))
+            if key not in queued:
+                queued.add(key)
                 file_item = {
                     "id": None, # Treeview item ID
                     "path": f_path,
-                    "tags": tags
+                    "tags": {}, # Filled in by _bulk_read_tags on the task pool
+                    "duration": None, # Seconds, from the same tag read; weights batch progress
+                    "size": sizes.get(f_path) if sizes else None # Folder scans carry it; otherwise the tag read's stat fills it
                 }
-                self.file_queue.append(file_item)
-                self._insert_file_row(file_item)
-                added += 1
+                new_items.append(file_item)
+        if new_items:
+            self.file_queue.extend(new_items)
+            self.log(f"Added {len(new_items)} item(s) to queue")
+            pending = [(item, item["path"]) for item in new_items]
+            chunks = range(0, len(pending), TAG_READ_CHUNK)
+            with self._tag_reads_lock:
+                self._tag_reads_pending += len(chunks)
+            for start in chunks:
+                self._submit_task(self._bulk_read_tags, pending[start:start + TAG_READ_CHUNK], self._queue_generation)
+            # Rows and counters go in together on the next idle cycle, so Tk repaints once
+            self.root.after_idle(self._show_added_items, new_items, self._queue_generation)
+
+    def _show_added_items(self, new_items, generation):
+        if generation != self._queue_generation:
+            return  # The queue was cleared before the rows were shown
+        self._insert_file_rows(new_items)
         self.count_var.set(f"{len(self.file_queue)} files")
-        if added:
-            self.status_var.set(f"Added {added} file(s)")
-            self.log(f"Added {added} item(s) to queue")
+        self.status_var.set(f"Added {len(new_items)} file(s)")
 
     def _clear_queue(self):
         self.file_queue.clear()
-        for row in self.tree.get_children(): self.tree.delete(row)
-        self.progress_var.set(0); self.progress_label.config(text="0%")
+        self._queue_set.clear()
+        self._items_by_id.clear()
+        self._queue_generation += 1
+        self._probe_cache.clear()
+        self.tree.delete(*self.tree.get_children()) # one Tcl call for the whole queue
+        self._show_progress(0)
         self.count_var.set("0 files"); self.status_var.set("Queue cleared")
         self.log("Queue cleared")
 
+    def _save_queue(self):
+        # Paths only: tags come back from the tag cache, which revalidates them by mtime and size.
+        # Before the restore has been applied the queue is still empty, and saving would lose it
+        if not self._queue_restored:
+            return
+        try:
+            _write_json_atomic(QUEUE_FILE, [item["path"] for item in self.file_queue], pretty=False)
+        except OSError:
+            self.log("Could not save the queue.", "warn")
+
+    def _restore_queue(self):
+        # Task pool: re-queue last session's files that still exist, without blocking startup
+        try:
+            paths = _read_json(QUEUE_FILE)
+        except (OSError, ValueError):
+            self._queue_restored = True
+            return
+        paths = [p for p in paths if isinstance(p, str) and os.path.isfile(p)]
+        if paths:
+            self._ui_call(self._apply_restored_queue, paths)
+        else:
+            self._queue_restored = True
+
+    def _apply_restored_queue(self, paths):
+        self._add_paths(paths)
+        self._queue_restored = True
+
+    def _tags_loading(self):
+        # Reads still running, or finished but not yet applied by _drain_tag_results
+        with self._tag_reads_lock:
+            pending = self._tag_reads_pending
+        return pending > 0 or not self._tag_results.empty()
+
+    def _bulk_read_tags(self, items, generation):
+        # Task thread: only reads files; results are applied on the Tk thread by _drain_tag_results
+        try:
+            for file_item, path_str in items:
+                self._tag_results.put((generation, file_item, *self._read_tags_cached(path_str)))
+        finally:
+            with self._tag_reads_lock:
+                self._tag_reads_pending -= 1
+                last = self._tag_reads_pending == 0
+            if last:
+                self._tag_cache.save()
+
+    def _read_tags_cached(self, path_str):
+        """(tags, duration, size or None). Unchanged files (same mtime and size) come from the
+        on-disk cache without parsing; the stat doubles as the size shown in the queue."""
+        try:
+            st = os.stat(path_str)
+        except OSError:
+            return (*self._read_tags(path_str), None)
+        cached = self._tag_cache.get(path_str, st)
+        if cached is not None:
+            return (*cached, st.st_size)
+        tags, duration = self._read_tags(path_str)
+        self._tag_cache.put(path_str, st, tags, duration)
+        return tags, duration, st.st_size
+
+    def _drain_tag_results(self):
+        for _ in range(TAG_DRAIN_BATCH):
+            try:
+                generation, file_item, tags, duration, size = self._tag_results.get_nowait()
+            except queue.Empty:
+                break
+            if generation != self._queue_generation:
+                continue  # Item belongs to a cleared queue
+            # Anything already edited in the tag editor wins over what was read from disk
+            tags.update(file_item["tags"])
+            file_item["tags"] = tags
+            file_item["duration"] = duration
+            if file_item["size"] is None:
+                file_item["size"] = size
+            if file_item["id"] is not None:
+                self.tree.item(file_item["id"], values=self._row_values(file_item))
+
     def _read_tags(self, path_str):
-        p = Path(path_str)
+        """(tags, duration in seconds or 0.0) for one file."""
         tags = {"title": "", "artist": "", "album": ""}
+        duration = 0.0
+        # TinyTag only seeks to the tag headers; mutagen covers whatever it cannot parse
+        if TinyTag is not None:
+            try:
+                tag = TinyTag.get(path_str)
+                tags["title"] = tag.title or ""
+                tags["artist"] = tag.artist or ""
+                tags["album"] = tag.album or ""
+                return tags, tag.duration or 0.0
+            except Exception:
+                pass
         try:
-            audio = File(path_str, easy=True)
+            audio = _mutagen_file()(path_str, easy=True)
             if audio:
                 tags["title"] = audio.get("title", [""])[0]
                 tags["artist"] = audio.get("artist", [""])[0]
                 tags["album"] = audio.get("album", [""])[0]
+                duration = getattr(audio.info, "length", 0.0) or 0.0
         except Exception as e:
-            self.log(f"Could not read tags for {p.name}: {e}", "warn")
-        return tags
+            self.log(f"Could not read tags for {os.path.basename(path_str)}: {e}", "warn")
+        return tags, duration
 
-    def _insert_file_row(self, file_item):
-        path_str = file_item["path"]
+    def _row_values(self, file_item):
         tags = file_item["tags"]
-        p = Path(path_str)
-        size = p.stat().st_size if p.exists() else 0
-        size_mb = f"{size/1024/1024:.2f} MB"
-        ext = p.suffix.lower().replace('.', '').upper()
-
-        item_id = self.tree.insert('', 'end', values=(
-            p.name, tags.get('title',''), tags.get('artist',''), tags.get('album',''),
-            ext, size_mb, str(p)
-        ))
-        file_item["id"] = item_id
+        # The path-derived cells never change, so they are worked out on the first call
+        # (the row insert) and reused when the tag read refreshes the row
+        static = file_item.get("row_static")
+        if static is None:
+            path_str = os.path.normpath(file_item["path"])
+            name = os.path.basename(path_str)
+            static = file_item["row_static"] = (name, os.path.splitext(name)[1][1:].upper(), path_str)
+        name, ext, path_str = static
+        return (name, tags.get('title',''), tags.get('artist',''), tags.get('album',''),
+                ext, "" if file_item["size"] is None else _human_size(file_item["size"]), path_str)
+
+    def _insert_file_rows(self, file_items):
+        # Format every row first, then insert in one burst with the scrollbar detached
+        # so Tk recomputes the scroll region once instead of once per row.
+        # Our own iids, assigned up front: Tk doesn't have to generate them and hand them back.
+        rows = [self._row_values(item) for item in file_items]
+        for file_item in file_items:
+            file_item["id"] = iid = f"f{next(self._row_ids)}"
+            self._items_by_id[iid] = file_item
+        yscroll = self.tree.cget("yscrollcommand")
+        self.tree.configure(yscrollcommand="")
+        try:
+            # Raw Tcl calls back to back: Treeview.insert() re-parses its options dict per row
+            call, tree = self.tree.tk.call, str(self.tree)
+            for file_item, values in zip(file_items, rows):
+                call(tree, "insert", "", "end", "-id", file_item["id"], "-values", values)
+        finally:
+            self.tree.configure(yscrollcommand=yscroll)
 
     def log(self, text: str, level="info"):
-        self.log_widget.configure(state="normal")
-        tag = {"info":None, "warn":"warn", "error":"error"}.get(level)
-        if tag: self.log_widget.insert("end", text + "\n", tag)
-        else:   self.log_widget.insert("end", text + "\n")
-        self.log_widget.see("end")
-        self.log_widget.configure(state="disabled")
+        # Safe from any thread; lines are written to the widget by _flush_logs
+        with self._log_lock:
+            self._log_buf.append((text, level))
+            if len(self._log_buf) > LOG_BUFFER_MAX:
+                del self._log_buf[:-LOG_BUFFER_MAX]
+
+    def _flush_logs(self):
+        with self._log_lock:
+            lines, self._log_buf = self._log_buf, []
+        if lines:
+            # One Text.insert with alternating (text, tag) pairs; consecutive lines sharing a tag are merged
+            chunks = []
+            for text, level in lines:
+                tag = _LOG_TAGS.get(level, "")
+                if chunks and chunks[-1] == tag:
+                    chunks[-2] += text + "\n"
+                else:
+                    chunks += [text + "\n", tag]
+            self.log_widget.configure(state="normal")
+            self.log_widget.insert("end", *chunks)
+            self.log_widget.see("end")
+            self.log_widget.configure(state="disabled")
 
     # ----- Processing -----
     def _sanitize_filename(self, name: str) -> str:
         # Remove illegal characters for Windows filenames, which is the most restrictive
-        return re.sub(r'[\\/*?:"<>|]', "_", name)
+        return name.translate(_FILENAME_BAD_CHARS)
 
     def _start_processing(self):
         if not self.file_queue:
@@ -782,68 +1375,316 @@ class MusicForgePro:
         outdir = self.output_directory.get()
         if not outdir:
             messagebox.showwarning("Output Folder", "Choose an output directory"); return
+        if self._tags_loading():
+            # Names, -metadata and progress weights all come from the tags; wait until every file has them
+            messagebox.showinfo("Reading Tags", "Still reading tags for the queued files. Please try again in a moment.")
+            return
 
         os.makedirs(outdir, exist_ok=True)
         self.process_btn.configure(text="Processing...", state='disabled')
-        self.progress_var.set(0); self.progress_label.config(text="0%")
+        self._show_progress(0)
         self.status_var.set("Processing…"); self.log("Processing started")
-        self.worker.submit(self._process_files)
-
-    def _process_files(self):
-        total = len(self.file_queue)
-        pattern = self.naming_pattern.get()
-
-        for i, file_item in enumerate(self.file_queue, start=1):
-            input_path = file_item["path"]
-            tags = file_item["tags"]
-            p_in = Path(input_path)
+        self.worker.submit(self._process_files, self._snapshot_settings(), list(self.file_queue))
+
+    def _snapshot_settings(self):
+        # Read every Tk variable once, on the UI thread; the worker only sees plain values.
+        # The per-run parts of the ffmpeg command are built here too, not once per file.
+        cpus = os.cpu_count() or 1
+        workers = min(cpus, max(1, len(self.file_queue)))
+        threads = max(1, cpus // workers)
+        fmt, qual = self.output_format.get(), self.quality_setting.get()
+        sr, ch = int(self.sample_rate.get()), int(self.channels.get())
+        compression_level = self._pick_compression_level(fmt, self.speed_target.get())
+        codec_args = _codec_args(fmt, qual)
+        if compression_level is not None:
+            codec_args = _with_compression_level(codec_args, compression_level)
+        afilters = _audio_filter_chain(self.trim_silence.get(), self.normalize.get(), self.fast_normalize.get())
+        encode_args = ("-threads", str(threads), "-ac", str(ch), "-ar", str(sr))
+        if afilters:
+            # Audio filter graphs gain nothing from extra threads
+            encode_args += ("-filter_threads", "1", "-af", afilters)
+        return SimpleNamespace(
+            workers=workers,                      # ffmpeg processes run side by side
+            threads=threads,                      # -threads for each of them
+            fmt=fmt, qual=qual, sr=sr, ch=ch,
+            afilters=afilters,                    # "" when no filter is active
+            codec_args=codec_args,
+            encode_args=encode_args,              # everything between -i and -metadata when transcoding
+            name_template=_naming_template(self.naming_pattern.get()),
+            outdir=self.output_directory.get(),
+            compression_level=compression_level,
+        )
 
-            try:
-                pct = int(((i-1) / total) * 100)
-                self._ui_progress(pct)
-                self.status_var.set(f"Processing: {p_in.name}")
-
-                # Generate filename from pattern
-                name = pattern.lower()
-                name = name.replace("[artist]", tags.get("artist") or "Unknown Artist")
-                name = name.replace("[album]", tags.get("album") or "Unknown Album")
-                name = name.replace("[title]", tags.get("title") or p_in.stem)
-                name = name.replace("[filename]", p_in.stem)
-                sanitized_name = self._sanitize_filename(name)
-
-                output_path = Path(self.output_directory.get()) / f"{sanitized_name}.{self.output_format.get()}"
-                cmd = self._build_ffmpeg_command(input_path, str(output_path), tags)
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                if result.returncode != 0:
-                    self.log(f"[ffmpeg] error for {p_in.name}:\n{result.stderr}", "error")
-                else:
-                    self.log(f"OK → {output_path.name}")
-            except Exception as e:
-                self.log(f"[error] {p_in.name}: {e}", "error")
+    # ----- Encoder speed table -----
+    def _pick_compression_level(self, fmt, target):
+        # Best level whose estimated speed meets the target; the fastest one if none does
+        levels = self._speed_table.get(fmt)
+        if not levels or target == "off":
+            return None
+        target = float(target)
+        with self._speed_lock:
+            for level, speed in levels.items():
+                if speed >= target:
+                    return level
+        return level
+
+    def _record_speed(self, fmt, level, speed):
+        with self._speed_lock:
+            levels = self._speed_table[fmt]
+            levels[level] = (1 - SPEED_EMA_WEIGHT) * levels[level] + SPEED_EMA_WEIGHT * speed
+
+    def _process_files(self, cfg, file_items):
+        total = len(file_items)
+        outdir = cfg.outdir
+
+        self._ui_progress(0)
+        self._ui_status(f"Processing {total} file(s)…")
+        done = 0
+
+        # Overall progress = finished files + the streamed fraction of each running file, weighted
+        # by track length so a long podcast moves the bar more than a voice note. Files of unknown
+        # length count as the average known track.
+        durations = [file_item.get("duration") or 0.0 for file_item in file_items]
+        known = [d for d in durations if d > 0]
+        fallback = sum(known) / len(known) if known else 1.0
+        weights = [d if d > 0 else fallback for d in durations]
+        total_weight = sum(weights)
+        progress_lock = threading.Lock()
+        fractions = [0.0] * total
+        completed = 0.0
+        last_pct = 0
+
+        def report(index, frac):
+            nonlocal completed, last_pct
+            with progress_lock:
+                completed += (frac - fractions[index]) * weights[index]
+                fractions[index] = frac
+                pct = max(0, min(int(completed / total_weight * 100), 100))
+                if pct == last_pct:
+                    return
+                last_pct = pct
+            self._ui_progress(pct)
+
+        out_names = self._output_names(file_items, cfg)
+
+        # Each pool task builds its own job (which may ffprobe the source for the stream-copy
+        # check) and then runs it; ffmpeg is its own process, so the threads only wait on children.
+        # Kept on self so closing the window can cancel the queued jobs: pool threads are not
+        # daemons, and the interpreter would otherwise finish the whole batch before exiting
+        self._compile_pool = ex = ThreadPoolExecutor(max_workers=min(cfg.workers, total))
+        with ex:
+            futures = {ex.submit(self._process_one, file_item, cfg, out_names[i], functools.partial(report, i)): i
+                       for i, file_item in enumerate(file_items)}
+            for fut in as_completed(futures):
+                if not self._alive:
+                    break
+                i = futures[fut]
+                in_name = os.path.basename(file_items[i]["path"])
+                try:
+                    out_name, returncode, errors = fut.result()
+                    if returncode != 0:
+                        self.log(f"[ffmpeg] error for {in_name}:\n{errors}", "error")
+                    else:
+                        self.log(f"OK → {out_name}")
+                except Exception as e:
+                    self.log(f"[error] {in_name}: {e}", "error")
+                done += 1
+                report(i, 1.0)
+                self._ui_status(f"Processed {done}/{total}: {in_name}")
+        self._compile_pool = None
 
         self._ui_progress(100)
-        self.status_var.set(f"Done — Processed {total} file(s) → {self.output_directory.get()}")
-        self.root.after(0, lambda: [self.process_btn.configure(text="🚀 Compile Music", state='normal'),
-                                    messagebox.showinfo("Processing Complete",
-                                                        f"Successfully processed {total} audio file(s)!\n\nOutput: {self.output_directory.get()}")])
+        self._ui_status(f"Done — Processed {total} file(s) → {outdir}")
         self.log("Processing complete")
-
-    def _build_ffmpeg_command(self, input_file, output_file, tags=None):
-        fmt = self.output_format.get()
-        qual = self.quality_setting.get()
-        sr = int(self.sample_rate.get())
-        ch = int(self.channels.get())
-
-        cmd = [FFMPEG_BIN, "-y", "-i", input_file, "-ac", str(ch), "-ar", str(sr)]
-
-        # Filters
-        afilters = []
-        if self.trim_silence.get():
-            afilters.append("silenceremove=start_periods=1:start_threshold=-45dB:start_silence=0.4")
-        if self.normalize.get():
-            afilters.append("loudnorm=I=-14:TP=-1.5:LRA=11")
-        if afilters:
-            cmd.extend(["-af", ",".join(afilters)])
+        self._ui_call(self._on_processing_done, total, outdir)
+
+    def _process_one(self, file_item, cfg, out_name, on_progress):
+        if not self._alive:
+            return out_name, -1, "cancelled"
+        run = self._build_job(file_item, cfg, out_name)
+        returncode, errors = run(on_progress)
+        return out_name, returncode, errors
+
+    def _on_processing_done(self, total, outdir):
+        self.process_btn.configure(text="🚀 Compile Music", state='normal')
+        self._save_config() # keep the speeds measured during this run
+        messagebox.showinfo("Processing Complete", f"Successfully processed {total} audio file(s)!\n\nOutput: {outdir}")
+
+    def _output_names(self, file_items, cfg):
+        """Output file name per item; names that would collide get " (2)", " (3)"… suffixes.
+
+        Runs on the compile thread before any job starts, so parallel jobs never share an output.
+        """
+        names, taken = [], set()
+        for file_item in file_items:
+            tags = file_item["tags"]
+            stem = os.path.splitext(os.path.basename(file_item["path"]))[0]
+            # Generate filename from the run's pre-compiled naming template
+            values = {
+                "artist": tags.get("artist") or "Unknown Artist",
+                "album": tags.get("album") or "Unknown Album",
+                "title": tags.get("title") or stem,
+                "filename": stem,
+            }
+            base = self._sanitize_filename(cfg.name_template.format_map(values))
+            out_name = f"{base}.{cfg.fmt}"
+            n = 1
+            while os.path.normcase(out_name) in taken:  # case-insensitive where the filesystem is
+                n += 1
+                out_name = f"{base} ({n}).{cfg.fmt}"
+            taken.add(os.path.normcase(out_name))
+            names.append(out_name)
+        return names
+
+    def _build_job(self, file_item, cfg, out_name):
+        """run(on_progress) -> (returncode, errors) writing one queued file to out_name."""
+        input_path = file_item["path"]
+        tags = file_item["tags"]
+        output_path = os.path.join(cfg.outdir, out_name)
+
+        # Nothing to transcode and only tags to set: copy the file and write them with mutagen
+        stream_copy = not cfg.afilters and self._can_stream_copy(input_path, cfg.fmt, cfg.sr, cfg.ch, cfg.codec_args)
+        if stream_copy and cfg.fmt in _TAG_COPY_FORMATS:
+            return functools.partial(self._copy_with_tags, input_path, output_path, tags)
+
+        duration = file_item["duration"]
+        cmd = self._build_ffmpeg_command(input_path, output_path, cfg, stream_copy, tags, duration)
+        # Filters (loudnorm resamples to 192 kHz) dominate the run time, so they'd drag the estimate down
+        speed_key = ((cfg.fmt, cfg.compression_level)
+                     if cfg.compression_level is not None and not cfg.afilters else None)
+        return functools.partial(self._run_ffmpeg, cmd, speed_key=speed_key, duration=duration)
+
+    def _copy_with_tags(self, input_path, output_path, tags, on_progress=None):
+        shutil.copyfile(input_path, output_path)
+        new_tags = {key: value for key, value in tags.items() if value}
+        if new_tags:
+            audio = _mutagen_file()(output_path, easy=True)
+            if audio is None:
+                raise ValueError("unsupported file type for tag writing")
+            if audio.tags is None:
+                audio.add_tags()
+            for key, value in new_tags.items():
+                audio[key] = value
+            audio.save()
+        return 0, ""
+
+    def _run_ffmpeg(self, cmd, on_progress=None, speed_key=None, duration=None):
+        """Run ffmpeg streaming its stderr; returns (returncode, last non-progress lines on failure)."""
+        # stderr is parsed as raw bytes; only the tail of a failed run is ever decoded.
+        # Without a known duration it is read from ffmpeg's own "Duration:" line.
+        tail = collections.deque(maxlen=40)
+        duration_us = int(duration * 1_000_000) if duration else 0
+        started = time.perf_counter()
+        proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, **_CHILD_POPEN_KW)
+        # Registered under the lock _on_close terminates under, so a job starting mid-close
+        # either is in the set by then or sees _alive cleared here
+        with self._children_lock:
+            self._children.add(proc)
+            solo = len(self._children) == 1
+            if not self._alive:
+                proc.terminate()
+        cpu_time = None
+        try:
+            with proc:
+                for line in proc.stderr:
+                    line = line.rstrip()
+                    m = _PROGRESS_LINE_RE.match(line)
+                    if m:
+                        # out_time_ms is (despite its name) in microseconds, same as out_time_us
+                        if m.group(1) in (b"out_time_us", b"out_time_ms") and duration_us and on_progress:
+                            try:
+                                # Negative during encoder priming (INT64_MIN on older builds)
+                                on_progress(max(0.0, min(int(m.group(2)) / duration_us, 1.0)))
+                            except ValueError:
+                                pass  # "N/A" before the first packet
+                        continue
+                    if not duration_us:
+                        d = _DURATION_RE.search(line)
+                        if d:
+                            h, mnt, sec = d.groups()
+                            duration_us = int((int(h) * 3600 + int(mnt) * 60 + float(sec)) * 1_000_000)
+                    tail.append(line)
+                if speed_key and _HAVE_WAIT4:
+                    # Reap it here for its own CPU time; the with-block's wait() sees returncode set
+                    _, status, usage = os.wait4(proc.pid, 0)
+                    proc.returncode = os.waitstatus_to_exitcode(status)
+                    cpu_time = usage.ru_utime + usage.ru_stime
+        finally:
+            with self._children_lock:
+                self._children.discard(proc)
+                solo = solo and not self._children
+        if proc.returncode == 0:
+            # CPU time where the platform reports it; otherwise wall time, but only when no
+            # other encode shared the cores
+            elapsed = cpu_time if cpu_time is not None else (time.perf_counter() - started if solo else 0)
+            if speed_key and duration_us and elapsed > 0:
+                self._record_speed(*speed_key, duration_us / 1_000_000 / elapsed)
+            return 0, ""
+        return proc.returncode, b"\n".join(tail).decode("utf-8", "replace")
+
+    def _probe_audio(self, input_file):
+        """First audio stream's codec/sample_rate/channels/bit_rate via ffprobe, cached per path."""
+        # One lookup: Clear Queue may empty the cache from the Tk thread between two
+        cached = self._probe_cache.get(input_file, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        info = None
+        if FFPROBE_BIN:
+            try:
+                # Only stdout (a small JSON document) is kept, as bytes; stderr is never read
+                result = subprocess.run([FFPROBE_BIN, "-v", "error", "-select_streams", "a:0",
+                                         "-show_entries", "stream=codec_name,sample_rate,channels,bit_rate",
+                                         "-of", "json", input_file], stdout=subprocess.PIPE,
+                                        stderr=subprocess.DEVNULL, **_CHILD_POPEN_KW)
+                if result.returncode == 0:
+                    data = result.stdout
+                    streams = (orjson.loads(data) if orjson else json.loads(data)).get("streams") or []
+                    info = streams[0] if streams else None
+            except (OSError, ValueError):
+                info = None
+        self._probe_cache[input_file] = info
+        return info
+
+    def _can_stream_copy(self, input_file, fmt, sr, ch, codec_args):
+        # ogg targets a VBR quality level that cannot be compared against the source; skip the probe
+        if fmt == "ogg" or os.path.splitext(input_file)[1].lower() != "." + fmt:
+            return False
+        info = self._probe_audio(input_file)
+        if not info:
+            return False
+        try:
+            if int(info.get("sample_rate") or 0) != sr or int(info.get("channels") or 0) != ch:
+                return False
+            codec = info.get("codec_name")
+            if fmt == "flac":
+                return codec == "flac"
+            if fmt == "wav":
+                return codec == "pcm_s16le"
+            if fmt in ("mp3", "m4a") and "-b:a" in codec_args:
+                # Same codec at (within 2% of) the requested bitrate
+                target = int(codec_args[codec_args.index("-b:a") + 1].rstrip("k")) * 1000
+                return codec == {"mp3": "mp3", "m4a": "aac"}[fmt] and abs(int(info.get("bit_rate") or 0) - target) <= target * 0.02
+        except ValueError:
+            pass
+        return False
+
+    def _build_ffmpeg_command(self, input_file, output_file, cfg, stream_copy, tags=None, duration=None):
+        # -progress streams key=value lines on stderr that _run_ffmpeg parses for per-file progress.
+        # -hide_banner drops the build/config dump. When the tag read already knows the track
+        # length, -loglevel error also drops the stream info; otherwise its "Duration:" line is needed.
+        # -threads: cfg.threads per ffmpeg so cfg.workers parallel jobs together fill the cores
+        threads = str(cfg.threads)
+        cmd = [FFMPEG_BIN, "-hide_banner", "-y", "-nostats"]
+        if duration:
+            cmd += ["-loglevel", "error"]
+        cmd += ["-progress", "pipe:2", "-threads", threads, "-i", input_file]
+
+        # Remux without decoding when the source already is what we would encode (_build_job checked)
+        if stream_copy:
+            # Copy every stream (embedded cover art too) and keep the source's tags; -metadata below overrides
+            cmd.extend(["-c", "copy", "-map_metadata", "0"])
+        else:
+            cmd.extend(cfg.encode_args)
 
         # Metadata
         if tags:
@@ -851,104 +1692,113 @@ class MusicForgePro:
                 if value: # Only add metadata if it's not empty
                     cmd.extend(["-metadata", f"{key}={value}"])
 
-        # Format presets
-        if fmt == "mp3":
-            qmap = {"low":["-b:a","128k"],"medium":["-b:a","192k"],"high":["-b:a","320k"],"lossless":["-b:a","320k"]}
-            cmd.extend(qmap.get(qual, ["-b:a", "192k"]))
-        elif fmt == "wav":
-            cmd.extend(["-acodec", "pcm_s16le"])
-        elif fmt == "flac":
-            cmd.extend(["-acodec", "flac", "-compression_level", "5"])
-        elif fmt == "ogg":
-            qmap = {"low":["-q:a","3"],"medium":["-q:a","6"],"high":["-q:a","9"],"lossless":["-q:a","10"]}
-            cmd.extend(qmap.get(qual, ["-q:a", "6"]))
-        elif fmt == "m4a":
-            qmap = {"low":["-c:a","aac","-b:a","128k"],"medium":["-c:a","aac","-b:a","192k"],"high":["-c:a","aac","-b:a","256k"],"lossless":["-c:a","aac","-b:a","320k"]}
-            cmd.extend(qmap.get(qual, ["-c:a", "aac", "-b:a", "192k"]))
+        if not stream_copy:
+            cmd.extend(cfg.codec_args)
 
         cmd.append(output_file)
         return cmd
 
+    def _submit_task(self, func, *args):
+        # Task-pool futures are never awaited, so report failures the way Worker does
+        def run():
+            try:
+                func(*args)
+            except Exception as e:
+                self.log(f"[error] {e}", "error")
+        self.tasks.submit(run)
+
     # ----- UI thread helpers -----
     def _ui_progress(self, pct: int):
-        self.root.after(0, lambda: [self.progress_var.set(pct), self.progress_label.config(text=f"{pct}%")])
+        # Only the latest value matters, so overwrite a single slot instead of queueing
+        if not self._alive:
+            return
+        with self._pending_lock:
+            self._pending_pct = pct
+
+    def _ui_status(self, text: str):
+        if not self._alive:
+            return
+        with self._pending_lock:
+            self._pending_status = text
+
+    def _ui_call(self, func, *args):
+        if self._alive:
+            self._ui_q.put(("call", func, args))
+
+    def _show_progress(self, pct: int):
+        if pct == self._last_pct_shown:
+            return
+        self._last_pct_shown = pct
+        # Bar and label change back to back; Tk repaints both in one idle pass.
+        # The bar is set directly: a bound variable would add a Tcl trace per update
+        self.progress["value"] = pct
+        self.progress_label["text"] = _PCT_STRS[pct]
+
+    def _ui_tick(self):
+        # Apply everything posted since the last tick; only the latest progress/status matter
+        with self._pending_lock:
+            pct, self._pending_pct = self._pending_pct, None
+            status, self._pending_status = self._pending_status, None
+        calls = []
+        while True:
+            try:
+                calls.append(self._ui_q.get_nowait()[1:])
+            except queue.Empty:
+                break
+        try:
+            if pct is not None:
+                self._show_progress(pct)
+            if status is not None:
+                self.status_var.set(status)
+            self._drain_tag_results()
+            self._flush_logs()
+            for func, args in calls:
+                func(*args)
+        finally:
+            # Fire at the next idle point after the interval, so a tick never jumps ahead of pending input/redraws.
+            # After close the pending tick is the last one, so nothing is scheduled against a destroyed root.
+            if self._alive:
+                self.root.after(UI_TICK_MS, self.root.after_idle, self._ui_tick)
 
     # ----- Dialogs -----
     def _show_about(self):
-        info = (
-            f"{APP_INFO['name']} v{APP_INFO['version']}\n"
-            f"Developed by {APP_INFO['developer']} — {APP_INFO['company']}\n"
-            f"Contact: {APP_INFO['contact']} | Web: {APP_INFO['website']}"
-        )
-        messagebox.showinfo("About Music Forge", info)
+        messagebox.showinfo("About Music Forge", _ABOUT_TEXT)
 
     def _show_help(self):
-        text = (
-            "How to Use:\n"
-            "1. Add Files: Click 'Add Files', 'Add Folder', or drag and drop files onto the queue.\n"
-            "2. Set Options: Pick a preset or manually set the format, quality, and other options.\n"
-            "3. Customize (Optional):\n"
-            "   - Presets: Save current settings as a new preset or delete custom ones.\n"
-            "   - Naming: Define an output filename pattern using tags like [artist], [title], etc.\n"
-            "   - Tags: Double-click a file or use 'Edit Tags' to modify its metadata for the output.\n"
-            "4. Choose Output Directory.\n"
-            "5. Click 'Compile Music' to start.\n\n"
-            "File Naming Tags:\n"
-            "Use [artist], [album], [title], and [filename] in the naming pattern field.\n\n"
-            "FFmpeg: place it next to the app, in ./bin, or in PATH. "
-            "Set FFMPEG_PATH env var to force a specific binary."
-        )
-        messagebox.showinfo("Help", text)
+        messagebox.showinfo("Help", _HELP_TEXT)
 
 # ---------- Tag Editor Window ----------
 class TagEditorWindow(tk.Toplevel):
-    def __init__(self, parent, file_items, callback):
+    """Created hidden once by the app and reused: load() shows a selection, Save/Cancel just hide it."""
+    FIELDS = (("title", "Title:"), ("artist", "Artist:"), ("album", "Album:"))
+
+    def __init__(self, parent):
         super().__init__(parent)
+        self.withdraw()
         self.transient(parent)
-        self.grab_set()
-        self.title(f"Edit Tags for {len(file_items)} Item(s)")
         self.geometry("450x230")
         self.resizable(False, False)
+        self.protocol("WM_DELETE_WINDOW", self.close)
 
-        self.file_items = file_items
-        self.callback = callback
-
-        # --- Determine initial values ---
-        def get_common_value(tag_name):
-            first_value = self.file_items[0]["tags"].get(tag_name, "")
-            if all(item["tags"].get(tag_name, "") == first_value for item in self.file_items):
-                return first_value
-            return "[Multiple Values]"
-
-        initial_title = get_common_value("title")
-        initial_artist = get_common_value("artist")
-        initial_album = get_common_value("album")
+        self.file_items = []
+        self.callback = None
+        self._build()
 
+    def _build(self):
         # --- UI Elements ---
         frame = ttk.Frame(self, padding=15)
         frame.pack(fill="both", expand=True)
         frame.columnconfigure(2, weight=1)
 
-        # Checkboxes
-        self.apply_title = tk.BooleanVar()
-        self.apply_artist = tk.BooleanVar()
-        self.apply_album = tk.BooleanVar()
-        ttk.Checkbutton(frame, variable=self.apply_title).grid(row=0, column=0, sticky="w", padx=(0,5))
-        ttk.Checkbutton(frame, variable=self.apply_artist).grid(row=1, column=0, sticky="w", padx=(0,5))
-        ttk.Checkbutton(frame, variable=self.apply_album).grid(row=2, column=0, sticky="w", padx=(0,5))
-
-        # Labels
-        ttk.Label(frame, text="Title:").grid(row=0, column=1, sticky="w", pady=5)
-        ttk.Label(frame, text="Artist:").grid(row=1, column=1, sticky="w", pady=5)
-        ttk.Label(frame, text="Album:").grid(row=2, column=1, sticky="w", pady=5)
-
-        # Entries
-        self.title_var = tk.StringVar(value=initial_title)
-        ttk.Entry(frame, textvariable=self.title_var).grid(row=0, column=2, sticky="ew", pady=5)
-        self.artist_var = tk.StringVar(value=initial_artist)
-        ttk.Entry(frame, textvariable=self.artist_var).grid(row=1, column=2, sticky="ew", pady=5)
-        self.album_var = tk.StringVar(value=initial_album)
-        ttk.Entry(frame, textvariable=self.album_var).grid(row=2, column=2, sticky="ew", pady=5)
+        # One row per tag: apply checkbox, label, entry
+        self.apply_vars = {}
+        self.value_vars = {}
+        for row, (key, label) in enumerate(self.FIELDS):
+            self.apply_vars[key] = apply_var = tk.BooleanVar()
+            self.value_vars[key] = value_var = tk.StringVar()
+            ttk.Checkbutton(frame, variable=apply_var).grid(row=row, column=0, sticky="w", padx=(0,5))
+            ttk.Label(frame, text=label).grid(row=row, column=1, sticky="w", pady=5)
+            ttk.Entry(frame, textvariable=value_var).grid(row=row, column=2, sticky="ew", pady=5)
 
         ttk.Label(frame, text="Check boxes to apply changes.", font=("Segoe UI", 8)).grid(row=3, column=1, columnspan=2, sticky="w", pady=(10,0))
 
@@ -956,25 +1806,74 @@ class TagEditorWindow(tk.Toplevel):
         btn_frame = ttk.Frame(self, padding=(0, 0, 15, 15))
         btn_frame.pack(fill="x")
         ttk.Button(btn_frame, text="Save", command=self.save, style="Accent.TButton").pack(side="right")
-        ttk.Button(btn_frame, text="Cancel", command=self.destroy).pack(side="right", padx=10)
+        ttk.Button(btn_frame, text="Cancel", command=self.close).pack(side="right", padx=10)
+
+    def load(self, file_items, callback):
+        self.file_items = file_items
+        self.callback = callback
+        self.title(f"Edit Tags for {len(file_items)} Item(s)")
+
+        # --- Determine initial values ---
+        def get_common_value(tag_name):
+            first_value = self.file_items[0]["tags"].get(tag_name, "")
+            if all(item["tags"].get(tag_name, "") == first_value for item in self.file_items):
+                return first_value
+            return "[Multiple Values]"
+
+        for key, _ in self.FIELDS:
+            self.value_vars[key].set(get_common_value(key))
+            self.apply_vars[key].set(False)
+
+        self.deiconify()
+        self.lift()
+        self.after_idle(self._grab) # grab once mapped; grabbing an unmapped window fails on X11
+
+    def _grab(self):
+        if not self.file_items:
+            return # closed before it was mapped
+        if self.winfo_viewable():
+            self.grab_set()
+        else:
+            self.after(20, self._grab)
+
+    def close(self):
+        self.grab_release()
+        self.withdraw()
+        self.file_items = []
+        self.callback = None
 
     def save(self):
-        tags_to_apply = {}
-        if self.apply_title.get():
-            tags_to_apply["title"] = self.title_var.get()
-        if self.apply_artist.get():
-            tags_to_apply["artist"] = self.artist_var.get()
-        if self.apply_album.get():
-            tags_to_apply["album"] = self.album_var.get()
+        tags_to_apply = {key: self.value_vars[key].get()
+                         for key, _ in self.FIELDS if self.apply_vars[key].get()}
 
+        file_items, callback = self.file_items, self.callback
+        self.close()
+        # Hide first; the row updates run once the dialog is gone
         if tags_to_apply:
-            self.callback(self.file_items, tags_to_apply)
-
-        self.destroy()
+            self.after_idle(callback, file_items, tags_to_apply)
 
 def main():
     app = MusicForgePro()
-    app.root.protocol("WM_DELETE_WINDOW", lambda: (app.worker.stop(), app.root.destroy()))
+
+    def _on_close():
+        # Neither stop call blocks; leave one UI tick for queued callbacks before Tk teardown
+        app._save_queue()
+        # Cancelled tag-read chunks never reach their save, so keep what this session did read
+        app._tag_cache.save()
+        app._alive = False
+        app.worker.stop()
+        app.tasks.shutdown(wait=False, cancel_futures=True)
+        # Drop the compile's queued jobs and stop the running encodes; pool threads are not
+        # daemons, so otherwise the process would outlive the window to finish the batch
+        pool = app._compile_pool
+        if pool:
+            pool.shutdown(wait=False, cancel_futures=True)
+        with app._children_lock:
+            for proc in app._children:
+                proc.terminate()
+        app.root.after(50, app.root.destroy)
+
+    app.root.protocol("WM_DELETE_WINDOW", _on_close)
     app.root.mainloop()
 
 if __name__ == "__main__":